@@ -4,20 +4,40 @@ from __future__ import annotations
 from sys import stdout,stderr,executable,version_info
 assert version_info.major>=3
 
+from os import environ
+NPRINT_QUIET=environ.get('NPRINT_QUIET','0')=='1' # silence nprint in batch runs
+
 from datetime import datetime
+import time as _time
 DATE_FORMAT,TIME_FORMAT='%m/%d/%Y','%H:%M:%S'
 DATETIME_FORMAT=DATE_FORMAT+" "+TIME_FORMAT
 
+_clock=[None,{}] # the current second and the strings already formatted within it
+
 def now(format=TIME_FORMAT):
-    """Quickly return the time."""
-    return datetime.now().strftime(format)
+    """Quickly return the time, calling strftime at most once per second for each format."""
+    if '%f' in format: # sub-second formats can't be reused within the second
+        return datetime.now().strftime(format)
+
+    second=int(_time.time())
+
+    if second!=_clock[0]:
+        _clock[:]=[second,{}]
+
+    if format not in _clock[1]:
+        _clock[1][format]=datetime.fromtimestamp(second).strftime(format)
+
+    return _clock[1][format]
     
 def today(format=DATE_FORMAT):
     """Quickly return the date."""
-    return datetime.now().strftime(format)
+    return now(format)
 
 def nprint(*args,**kwargs):
     """Decorate the print statement with the time."""
+    if NPRINT_QUIET:
+        return
+
     print(now(),*args,**kwargs)
     stdout.flush()
 
@@ -70,9 +90,12 @@ try:
     ip=get_ipython()
 
     if ip is not None and 'google' in str(ip):
+        from importlib.util import find_spec
+
         for package in 'yfinance','arch':
-            nprint("Installing %s into Google notebook..." % package)
-            ip.system("pip install %s 1>/dev/null" % package)
+            if find_spec(package) is None: # don't spawn pip for packages that are already there
+                nprint("Installing %s into Google notebook..." % package)
+                ip.system("pip install %s 1>/dev/null" % package)
             
         from tqdm.notebook import tqdm
 
@@ -114,7 +137,15 @@ class GARCH2(GARCH):
     """Version of GARCH with constraints modified to be more relaxed, leads to models that don't bind on constraints."""
     def bounds(self,resids:Float64Array)->list[tuple[float,float]]:
         """Modify bounds to be more relaxed."""
-        v=float(np.mean(abs(resids)**self.power))
+        power=self.power
+
+        if power==two:
+            v=float(np.mean(resids*resids))
+        elif power==one:
+            v=float(np.mean(np.abs(resids)))
+        else:
+            v=float(np.mean(np.abs(resids)**power))
+
         bounds=[(1e-8*v,ten*v)]
         bounds.extend([(-one,two)]*(self.p+self.o+self.q))
         return bounds
@@ -130,13 +161,38 @@ from matplotlib.ticker import Formatter
 
 class DirectionalLabels(Formatter):
     """Base class to provide directional formats for matplotlib axes."""
+    MEMO_SIZE=1024 # matplotlib renders the same tick values over and over on redraw
+    _memo=None
 
     def __init__(self):
         """Abstract base class."""
         raise NotImplementedError("DirectionalLabels is an abstract base class. You cannot instantiate it directly.")
 
+    def __setattr__(self,name,value):
+        """Forget rendered labels whenever an attribute that shapes them changes."""
+        if name in ('plus','minus','zero','scale'):
+            object.__setattr__(self,'_memo',None)
+
+        object.__setattr__(self,name,value)
+
     def __call__(self,datum,pos=None):
-        """Render the provided number as a string."""
+        """Render the provided number as a string, reusing the label if this value has been seen before."""
+        if datum!=datum: # NaN never matches itself as a key
+            return self._render(datum)
+
+        memo=self._memo
+
+        if memo is None or len(memo)>=self.MEMO_SIZE:
+            memo=self._memo={}
+
+        try:
+            return memo[datum]
+        except KeyError:
+            label=memo[datum]=self._render(datum)
+            return label
+
+    def _render(self,datum):
+        """Format the provided number."""
         return self.plus.format(datum*self.scale) if datum>0e0 else self.minus.format(-datum*self.scale) if datum<0e0 else self.zero
     
 class PercentLabels(DirectionalLabels):